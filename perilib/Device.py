@@ -46,6 +46,7 @@ class Device:
         through all necessary checks and trigger any relevant data processing
         and callbacks."""
 
-        if mode in [ProcessMode.BOTH, ProcessMode.SUBS]:
-            if self.stream is not None:
-                self.stream.process(mode=ProcessMode.BOTH, force=force)
+        if mode & ProcessMode.SUBS:
+            stream = self.stream
+            if stream is not None:
+                stream.process(mode=ProcessMode.BOTH, force=force)
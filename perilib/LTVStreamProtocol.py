@@ -4,6 +4,15 @@ from .StreamPacket import *
 
 class LTVStreamProtocol(StreamProtocol):
 
+    definition = {
+        "name": "ltv_packet",
+        "args": [
+            { "name": "length", "type": "uint8" },
+            { "name": "type", "type": "uint8" },
+            { "name": "value", "type": "uint8a-greedy" }
+        ]
+    }
+
     @classmethod
     def test_packet_complete(cls, buffer, is_tx=False) -> ParseStatus:
         # simple terminal condition for LTV data, where L/T are single bytes
@@ -13,14 +22,11 @@ class LTVStreamProtocol(StreamProtocol):
         else:
             return ParseStatus.IN_PROGRESS
 
+    @classmethod
+    def get_packet_length(cls, buffer, is_tx=False) -> int:
+        # total length is known as soon as the length byte has arrived
+        return buffer[0] + 1
+
     @classmethod
     def get_packet_from_buffer(cls, buffer, parser_generator=None, is_tx=False) -> StreamPacket:
-        definition = {
-            "name": "ltv_packet",
-            "args": [
-                { "name": "length", "type": "uint8" },
-                { "name": "type", "type": "uint8" },
-                { "name": "value", "type": "uint8a-greedy" }
-            ]
-        }
-        return StreamPacket(buffer=buffer, definition=definition, parser_generator=parser_generator)
+        return StreamPacket(buffer=buffer, definition=cls.definition, parser_generator=parser_generator)
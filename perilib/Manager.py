@@ -29,6 +29,8 @@ class Manager:
         # these attributes may be updated by the application
         self.device_filter = None
         self.check_interval = 1.0
+        self.max_check_interval = None
+        self.disconnect_debounce = 0
         self.on_connect_device = None
         self.on_disconnect_device = None
 
@@ -37,7 +39,12 @@ class Manager:
         self.devices = {}
 
         # these attributes are intended to be private
-        self._last_process_time = 0
+        self._last_process_time = None
+        self._last_connected_ids = None
+        self._last_device_ids = None
+        self._check_interval_scale = 1
+        self._missing_since = {}
+        self._filter_rejected = False
 
     def process(self, mode=ProcessMode.BOTH, force=False) -> None:
         """Handle any pending events or data waiting to be processed.
@@ -53,52 +60,112 @@ class Manager:
         This method must be executed inside of a constant event loop to step
         through all necessary checks and trigger any relevant data processing
         and callbacks. Calling this method will automatically call it on all
-        associated device objects."""
+        associated device objects.
 
-        # check for new devices on the configured interval
-        t0 = time.time()
-        if mode in [ProcessMode.SELF, ProcessMode.BOTH] \
-                and (force or time.time() - self._last_process_time >= self.check_interval):
-            self._last_process_time = time.time()
+        If `max_check_interval` is set, the interval between device checks is
+        doubled each time a check finds nothing changed, up to that limit, and
+        drops back to `check_interval` as soon as something changes.
+
+        If `disconnect_debounce` is set, a known device must be missing from the
+        connected device list for at least that many seconds before it is
+        disconnected, so a device that briefly drops out (e.g. during a USB hub
+        reset) and comes back is treated as never having left. This does not
+        apply to devices that `_is_device_lost()` reports as unusable."""
 
-            # assume every previously connected device is no longer connected
-            ids_to_disconnect = list(self.devices.keys())
+        # check for new devices on the configured interval
+        # (monotonic, since wall clock adjustments must not delay or repeat a
+        # check; no previous check time means one is due immediately)
+        now = time.monotonic()
+        if mode & ProcessMode.SELF \
+                and (force or self._last_process_time is None \
+                    or now - self._last_process_time >= self.check_interval * self._check_interval_scale):
+            self._last_process_time = now
 
             # build the active list of filtered devices
             connected_devices = self._get_connected_devices()
-            for device_id, device in connected_devices.items():
-                # remove this device from list of assumed disconnections
-                if device_id in ids_to_disconnect:
-                    ids_to_disconnect.remove(device_id)
 
-                # apply filter, skip if it doesn't pass
-                if self.device_filter is not None and not self.device_filter(device):
-                    continue
-
-                # add this device to the list if not already present
-                if device_id not in self.devices:
-                    self.devices[device_id] = device
+            # skip reconciliation if neither the connected devices nor the known
+            # devices have changed since the last time it ran, unless the filter
+            # rejected a device last time (it may accept it now, since filters
+            # can be replaced or depend on application state)
+            connected_ids = frozenset(connected_devices)
+            devices = self.devices
+            changed = connected_ids != self._last_connected_ids or devices.keys() != self._last_device_ids \
+                    or self._missing_since
+            if changed or self._filter_rejected:
+                device_filter = self.device_filter
+                filter_rejected = False
+                for device_id, device in connected_devices.items():
+                    # nothing to do for devices that are already known, unless
+                    # one came back within the debounce window but was lost in
+                    # the meantime (it is disconnected for real then, so it
+                    # gets set up again from scratch on a later check)
+                    if device_id in devices:
+                        if device_id in self._missing_since and self._is_device_lost(devices[device_id]):
+                            self._on_disconnect_device(devices[device_id])
+                            devices.pop(device_id, None)
+                        continue
+
+                    # apply filter, skip if it doesn't pass
+                    if device_filter is not None and not device_filter(device):
+                        filter_rejected = True
+                        continue
+
+                    # add this device to the list
+                    devices[device_id] = device
 
                     # trigger the connection callback
                     self._on_connect_device(device)
 
-            # disconnect devices that were there before and aren't anymore
-            for device_id in ids_to_disconnect:
-                if device_id in self.devices:
-                    # trigger the disconnection callback
-                    self._on_disconnect_device(self.devices[device_id])
-
-                    # remove this port from the list
-                    try:
-                        del self.devices[device_id]
-                    except KeyError as e:
-                        # already removed
-                        pass
+                # disconnect devices that were there before and aren't anymore
+                # (dict lookups rather than removals from a list, keeping the
+                # known device order)
+                ids_to_disconnect = [device_id for device_id in devices if device_id not in connected_devices]
+                disconnect_debounce = self.disconnect_debounce
+                missing_since = {}
+                for device_id in ids_to_disconnect:
+                    device = devices.get(device_id)
+                    if device is not None:
+                        if disconnect_debounce and not self._is_device_lost(device):
+                            # hold off until the device has been gone long enough
+                            t0 = self._missing_since.get(device_id, now)
+                            if now - t0 < disconnect_debounce:
+                                missing_since[device_id] = t0
+                                continue
+
+                        # trigger the disconnection callback
+                        self._on_disconnect_device(device)
+
+                        # remove this port from the list (may already have
+                        # been removed by the disconnection handler)
+                        devices.pop(device_id, None)
+
+                # devices that came back in the meantime are forgotten here
+                self._missing_since = missing_since
+
+                # remember what this reconciliation was based on (a filter that
+                # still rejects the same devices doesn't count as a change)
+                changed = changed or devices.keys() != self._last_device_ids
+                self._last_connected_ids = connected_ids
+                self._last_device_ids = frozenset(devices)
+                self._filter_rejected = filter_rejected
+
+            if changed:
+                # check at the normal rate again after any change
+                self._check_interval_scale = 1
+            elif self.max_check_interval is not None and self.check_interval > 0:
+                # back off while nothing changes (a limit below check_interval
+                # must not make checks more frequent than configured)
+                self._check_interval_scale = max(1, min(self._check_interval_scale * 2, self.max_check_interval / self.check_interval))
+            else:
+                # backoff disabled (possibly since the last check)
+                self._check_interval_scale = 1
 
         # allow known devices to process immediately
-        if mode in [ProcessMode.BOTH, ProcessMode.SUBS]:
-            for device_id in list(self.devices.keys()):
-                self.devices[device_id].process(mode=ProcessMode.BOTH, force=force)
+        if mode & ProcessMode.SUBS:
+            # (copied, since processing may disconnect and remove a device)
+            for device in list(self.devices.values()):
+                device.process(mode=ProcessMode.BOTH, force=force)
 
     def _get_connected_devices(self) -> dict:
         """Gets a collection of all currently connected devices.
@@ -117,6 +184,22 @@ class Manager:
         # child class must implement
         raise PerilibHalException("Child class has not implemented _get_connected_devices() method, cannot use base class stub")
 
+    def _is_device_lost(self, device) -> bool:
+        """Checks whether a missing device cannot simply resume if it comes back.
+
+        :param device: Device that is missing from the connected device list
+        :type device: Device
+
+        :returns: True if the device must be disconnected despite debouncing
+        :rtype: bool
+
+        This is only consulted while `disconnect_debounce` is holding off the
+        disconnection of a device. The default implementation always returns
+        False; child classes may override it, e.g. when the device's stream has
+        been closed in the meantime and would otherwise never be reopened."""
+
+        return False
+
     def _on_connect_device(self, device) -> None:
         """Handles device connections.
 
@@ -148,13 +148,19 @@ class Stream:
         not be necessary unless the stream itself needs extra insight into the
         data content."""
 
+        # nothing to report or parse for an empty read
+        if not data:
+            return
+
         # child class may re-implement
         run_builtin = True
-        if self.on_rx_data:
-            run_builtin = self.on_rx_data(data, self)
+        on_rx_data = self.on_rx_data
+        if on_rx_data:
+            run_builtin = on_rx_data(data, self)
 
         # derived Stream classes can do special things at this point
         if run_builtin != False:
             # parse automatically if we have a parser attached
-            if self.parser_generator is not None:
-                self.parser_generator.parse(data)
+            parser_generator = self.parser_generator
+            if parser_generator is not None:
+                parser_generator.parse(data)
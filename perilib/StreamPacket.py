@@ -128,12 +128,15 @@ class StreamPacket():
         and byte buffer are supplied when instantiating a new packet, but you
         can also call it by hand afterwards if necessary."""
 
+        # slice through a view so each section is unpacked without a copy
+        buffer = memoryview(self.buffer)
+
         # header (optional)
         if "header_args" in self.definition:
             header_packing_info = StreamProtocol.calculate_packing_info(self.definition["header_args"])
             header_expected_length = header_packing_info["expected_length"]
             self.header = StreamProtocol.unpack_values(
-                self.buffer[:header_expected_length],
+                buffer[:header_expected_length],
                 self.definition["header_args"],
                 header_packing_info
             )
@@ -146,7 +149,7 @@ class StreamPacket():
             footer_packing_info = StreamProtocol.calculate_packing_info(self.definition["footer_args"])
             footer_expected_length = footer_packing_info["expected_length"]
             self.footer = StreamProtocol.unpack_values(
-                    self.buffer[-footer_expected_length:],
+                    buffer[-footer_expected_length:],
                     self.definition["footer_args"],
                     footer_packing_info)
         else:
@@ -156,7 +159,7 @@ class StreamPacket():
         # payload (required)
         payload_packing_info = StreamProtocol.calculate_packing_info(self.definition[self.TYPE_ARG_CONTEXT[self.type]])
         self.payload = StreamProtocol.unpack_values(
-                self.buffer[header_expected_length:len(self.buffer)-footer_expected_length],
+                buffer[header_expected_length:len(buffer)-footer_expected_length],
                 self.definition[self.TYPE_ARG_CONTEXT[self.type]],
                 payload_packing_info)
 
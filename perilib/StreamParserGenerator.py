@@ -44,7 +44,11 @@ class StreamParserGenerator:
         You must allow your application code to call the `process()` method
         continuously (either directly or via a stream, device, or manager higher
         up in the chain) in order to ensure timely reactions to incoming data
-        and duration checks."""
+        and duration checks.
+
+        The `on_rx_error` and `on_incoming_packet_timeout` callbacks receive the
+        parser's receive buffer as a mutable `bytearray`. Copy it with `bytes()`
+        if it needs to be kept or hashed."""
 
         # these attributes may be updated by the application
         self.protocol_class = protocol_class
@@ -97,7 +101,9 @@ class StreamParserGenerator:
         while processing incoming data, but you can also call it externally if
         necessary (though it is usually not needed)."""
 
-        self.rx_buffer = b''
+        # a fresh buffer (rather than clearing in place) so that any reference
+        # handed to a callback keeps its contents
+        self.rx_buffer = bytearray()
         self.parser_status = ParseStatus.IDLE
         self._incoming_packet_t0 = 0
 
@@ -138,7 +144,21 @@ class StreamParserGenerator:
         This method standardizes input data into a `bytes()` format, then passes
         this data one byte at a time to the `parse_byte()` method. Although you
         can use the `parse_byte()` method directly, this one allows objects of
-        various types as input and is therefore the more "friendly" option."""
+        various types as input and is therefore the more "friendly" option.
+
+        For protocols that rely only on terminal bytes to detect packet
+        boundaries (such as `TextStreamProtocol`), the data is instead scanned
+        for terminal and backspace bytes in a single call, and only those bytes
+        are passed individually to `parse_byte()`. For protocols that declare
+        packet lengths (such as `TLVStreamProtocol`), the body of each packet is
+        copied in one step once its length is known. The results are identical
+        in both cases. Subclasses that override `parse_byte()` always receive
+        every byte individually."""
+
+        # pick up terminal or backspace lists or test methods assigned to the
+        # protocol since the last refresh
+        protocol_class = self.protocol_class
+        protocol_class._refresh_if_changed()
 
         if isinstance(input_data, (int,)):
             # given a single integer, so convert it to bytes first
@@ -147,6 +167,14 @@ class StreamParserGenerator:
             # given a list, so convert it to bytes first
             input_data = bytes(input_data)
 
+        # use the chunk scanner if the protocol supports it (but only if every
+        # byte isn't expected to go through an overridden parse_byte() method)
+        if type(self).parse_byte is StreamParserGenerator.parse_byte:
+            if protocol_class._boundary_pattern is not None:
+                return self._parse_terminated(input_data, is_tx)
+            elif protocol_class._declared_length:
+                return self._parse_declared_length(input_data, is_tx)
+
         # input_data here is now a bytes(...) buffer
         result = None
         for input_byte_as_int in input_data:
@@ -155,6 +183,80 @@ class StreamParserGenerator:
         # send back the last result (useful for parsing complete packets)
         return result
 
+    def _parse_terminated(self, input_data, is_tx=False) -> StreamPacket:
+        """Parse a chunk of data for a terminal-byte protocol.
+
+        :param input_data: Byte buffer to parse immediately
+        :type input_data: bytes
+
+        With the default start and completion tests, any byte which is neither
+        a terminal byte nor a backspace byte simply starts or extends the
+        current packet. Runs of such bytes are located with the protocol's
+        precompiled boundary pattern and appended to the buffer all at once,
+        while boundary bytes go through `parse_byte()` as usual."""
+
+        pattern = self.protocol_class._boundary_pattern
+        result = None
+        position = 0
+        length = len(input_data)
+        while position < length:
+            match = pattern.search(input_data, position)
+            end = match.start() if match is not None else length
+
+            if end > position:
+                # ordinary data, which starts a packet if we're idle
+                if self.parser_status == ParseStatus.IDLE:
+                    self.parser_status = ParseStatus.IN_PROGRESS
+
+                    # if we just started and there's a defined timeout, start the timer
+                    if self.incoming_packet_timeout is not None:
+                        self._incoming_packet_t0 = time.monotonic()
+
+                self.rx_buffer += input_data[position:end]
+                result = None
+
+            if match is None:
+                break
+
+            # boundary byte, process normally
+            result = self.parse_byte(input_data[end], is_tx)
+            position = end + 1
+
+        # send back the last result (useful for parsing complete packets)
+        return result
+
+    def _parse_declared_length(self, input_data, is_tx=False) -> StreamPacket:
+        """Parse a chunk of data for a protocol with declared packet lengths.
+
+        :param input_data: Byte buffer to parse immediately
+        :type input_data: bytes
+
+        Bytes are passed to `parse_byte()` until the protocol is able to report
+        the total length of the packet in progress. Everything up to (but not
+        including) the final byte of that packet is then appended to the
+        buffer all at once, and the final byte goes through `parse_byte()` so
+        that completion is detected and handled normally."""
+
+        result = None
+        position = 0
+        length = len(input_data)
+        while position < length:
+            result = self.parse_byte(input_data[position], is_tx)
+            position += 1
+
+            if self.parser_status == ParseStatus.IN_PROGRESS:
+                packet_length = self.protocol_class.get_packet_length(self.rx_buffer, is_tx)
+                if packet_length is not None:
+                    # copy all but the final byte of the packet directly
+                    count = min(packet_length - len(self.rx_buffer) - 1, length - position)
+                    if count > 0:
+                        self.rx_buffer += input_data[position:position + count]
+                        position += count
+                        result = None
+
+        # send back the last result (useful for parsing complete packets)
+        return result
+
     def parse_byte(self, input_byte_as_int, is_tx=False) -> StreamPacket:
         """Parse a byte of data according to the associated protocol definition.
 
@@ -182,15 +284,19 @@ class StreamParserGenerator:
         timeout is defined)."""
 
         # add byte to buffer (note, byte may be removed later if detected as backspace)
-        self.rx_buffer += bytes([input_byte_as_int])
+        self.rx_buffer.append(input_byte_as_int)
 
         if self.parser_status == ParseStatus.IDLE:
             # not already in a packet, so run through start boundary test function
-            self.parser_status = self.protocol_class.test_packet_start(self.rx_buffer, self)
+            if self.protocol_class._custom_packet_start:
+                self.parser_status = self.protocol_class.test_packet_start(self.rx_buffer, self)
+            else:
+                # default start test treats any byte as the start of a packet
+                self.parser_status = ParseStatus.IN_PROGRESS
 
             # if we just started and there's a defined timeout, start the timer
             if self.parser_status != ParseStatus.IDLE and self.incoming_packet_timeout is not None:
-                self._incoming_packet_t0 = time.time()
+                self._incoming_packet_t0 = time.monotonic()
 
         # if we are (or may be) in a packet now, process
         if self.parser_status != ParseStatus.IDLE:
@@ -203,10 +309,10 @@ class StreamParserGenerator:
                 # remove backspace + previous byte from buffer, if possible
                 if len(self.rx_buffer) > 1:
                     # buffer had data in it before
-                    self.rx_buffer = self.rx_buffer[:-2]
+                    del self.rx_buffer[-2:]
                 else:
                     # buffer had no data, so just remove the backspace
-                    self.rx_buffer = self.rx_buffer[:-1]
+                    del self.rx_buffer[-1:]
 
                 # check for empty buffer
                 if len(self.rx_buffer) == 0:
@@ -226,11 +332,11 @@ class StreamParserGenerator:
                 if self.protocol_class.trim_bytes is not None and len(self.protocol_class.trim_bytes) > 0:
                     for b in self.protocol_class.trim_bytes:
                         if self.rx_buffer[-1] == b:
-                            self.rx_buffer = self.rx_buffer[:-1]
+                            del self.rx_buffer[-1:]
 
                 # convert the buffer to a packet
                 try:
-                    self.last_rx_packet = self.protocol_class.get_packet_from_buffer(self.rx_buffer, self, is_tx)
+                    self.last_rx_packet = self.protocol_class.get_packet_from_buffer(bytes(self.rx_buffer), self, is_tx)
 
                     # reset the parser
                     self.reset()
@@ -310,7 +416,7 @@ class StreamParserGenerator:
             self.packet_pending = packet.definition["response_required"]
             if self.packet_pending is not None:
                 self._use_waiting_packet_timeout = self.waiting_packet_timeout
-                self._waiting_packet_t0 = time.time()
+                self._waiting_packet_t0 = time.monotonic()
 
         return result
 
@@ -354,7 +460,7 @@ class StreamParserGenerator:
                     self._use_waiting_packet_timeout = self.waiting_packet_timeout
                 else:
                     self._use_waiting_packet_timeout = timeout
-                self._waiting_packet_t0 = time.time()
+                self._waiting_packet_t0 = time.monotonic()
 
                 # wait for the new packet
                 while self.packet_pending is not None:
@@ -406,11 +512,15 @@ class StreamParserGenerator:
         while len(self.rx_deque) > 0:
             self.parse_byte(self.rx_deque.popleft())
 
-        if self.incoming_packet_timeout is not None and self._incoming_packet_t0 != 0 and time.time() - self._incoming_packet_t0 > self.incoming_packet_timeout:
-            self._incoming_packet_timed_out();
+        # skip reading the clock entirely if no timers are running
+        if self._incoming_packet_t0 or self._waiting_packet_t0:
+            now = time.monotonic()
+
+            if self.incoming_packet_timeout is not None and self._incoming_packet_t0 and now - self._incoming_packet_t0 > self.incoming_packet_timeout:
+                self._incoming_packet_timed_out()
 
-        if self._use_waiting_packet_timeout is not None and self._waiting_packet_t0 != 0 and time.time() - self._waiting_packet_t0 > self._use_waiting_packet_timeout:
-            self._response_packet_timed_out();
+            if self._use_waiting_packet_timeout is not None and self._waiting_packet_t0 and now - self._waiting_packet_t0 > self._use_waiting_packet_timeout:
+                self._response_packet_timed_out()
 
     def _on_tx_packet(self, packet) -> None:
         """Internal callback for when a packet is transmitted.
@@ -1,8 +1,54 @@
+import collections
+import re
 import struct
 
 from .common import *
 from .Exceptions import *
 
+# packing info and field offsets are calculated once per field definition list
+# and reused; each entry holds a reference to the list itself so that a
+# recycled id() can never match a different definition
+_packing_info_cache = collections.OrderedDict()
+_field_offset_cache = collections.OrderedDict()
+_cache_limit = 256
+
+# field kinds used in precomputed packing plans
+_FIELD_STANDARD = 0
+_FIELD_MACADDR = 1
+_FIELD_PREFIXED_BLOB = 2
+_FIELD_GREEDY_BLOB = 3
+
+def _cache_lookup(cache, key, fields):
+    """Fetch a cached result for a field definition list, if present."""
+
+    entry = cache.get(key)
+    if entry is not None and entry[0] is fields:
+        # mark as most recently used
+        cache.move_to_end(key)
+        return entry[1]
+    return None
+
+def _cache_store(cache, key, fields, value):
+    """Store a result for a field definition list, evicting the oldest."""
+
+    cache[key] = (fields, value)
+    if len(cache) > _cache_limit:
+        cache.popitem(last=False)
+
+def _defining_class(cls, name):
+    """Find the class in a class hierarchy that defines an attribute."""
+
+    for klass in cls.__mro__:
+        if name in klass.__dict__:
+            return klass
+    return None
+
+def _class_attribute(cls, name):
+    """Find the raw definition of an attribute in a class hierarchy."""
+
+    klass = _defining_class(cls, name)
+    return klass.__dict__[name] if klass is not None else None
+
 class StreamProtocol():
     """Generic stream protocol definition.
 
@@ -36,10 +82,96 @@ class StreamProtocol():
     incoming_packet_timeout = None
     waiting_packet_timeout = None
 
+    # terminal entries may be single byte values or multi-byte sequences
+    # (e.g. b"\r\n"); backspace and trim entries are single byte values;
+    # assigning a new list to these at runtime is picked up automatically, but
+    # call `refresh()` after modifying a list in place
     backspace_bytes = None
     terminal_bytes = None
     trim_bytes = None
 
+    # derived from the class definition by refresh(), along with the lists
+    # and test methods they were derived from
+    _terminal_tuple = None
+    _custom_packet_start = False
+    _custom_packet_complete = False
+    _boundary_pattern = None
+    _declared_length = False
+    _terminal_source = None
+    _backspace_source = None
+    _start_source = None
+    _complete_source = None
+
+    def __init_subclass__(cls, **kwargs):
+        """Prepares derived lookup data for protocol subclasses.
+
+        See `refresh()` for details."""
+
+        super().__init_subclass__(**kwargs)
+        cls.refresh()
+
+    @classmethod
+    def refresh(cls) -> None:
+        """Rebuilds lookup data derived from the protocol class definition.
+
+        The `terminal_bytes` list is converted into a tuple of byte strings so
+        that completion tests are a single `endswith()` call, which also allows
+        multi-byte terminators.
+
+        This also records whether `test_packet_start()` and
+        `test_packet_complete()` have been overridden. The parser can skip
+        calling the default start test (which accepts any byte) for every
+        incoming byte, and protocols relying only on the default tests with
+        terminal bytes get a compiled pattern matching every byte that needs
+        individual attention (terminal and backspace bytes). The parser uses
+        this to scan incoming chunks for packet boundaries in a single call
+        instead of testing each byte separately. Similarly, protocols that
+        implement `get_packet_length()` (and have no backspace bytes) let the
+        parser copy the rest of a packet in bulk once its length is known, as
+        long as `test_packet_complete()` is defined in the same class.
+
+        This runs automatically when a subclass is defined, and again (on the
+        next parse) whenever a different `terminal_bytes` or `backspace_bytes`
+        list or a different test method is assigned to the class. Call it
+        explicitly after modifying one of those lists in place."""
+
+        cls._terminal_source = cls.terminal_bytes
+        cls._backspace_source = cls.backspace_bytes
+        if cls.terminal_bytes:
+            cls._terminal_tuple = tuple(bytes([b]) if isinstance(b, int) else bytes(b) for b in cls.terminal_bytes)
+        else:
+            cls._terminal_tuple = None
+        # compare raw definitions, since overrides may also be static methods
+        # or plain functions
+        cls._start_source = _class_attribute(cls, "test_packet_start")
+        cls._complete_source = _class_attribute(cls, "test_packet_complete")
+        cls._custom_packet_start = cls._start_source is not StreamProtocol.__dict__["test_packet_start"]
+        cls._custom_packet_complete = cls._complete_source is not StreamProtocol.__dict__["test_packet_complete"]
+        if cls._terminal_tuple and not cls._custom_packet_start and not cls._custom_packet_complete:
+            # a packet can only complete on the last byte of a terminator
+            boundary_set = set(terminal[-1] for terminal in cls._terminal_tuple)
+            boundary_bytes = bytes(sorted(boundary_set.union(cls.backspace_bytes or [])))
+            cls._boundary_pattern = re.compile(b"[" + re.escape(boundary_bytes) + b"]")
+        else:
+            cls._boundary_pattern = None
+        # only trust the declared length if it comes from the same class as the
+        # completion test, since a subclass may redefine the packet framing
+        # without also updating get_packet_length()
+        length_class = _defining_class(cls, "get_packet_length")
+        cls._declared_length = not cls.backspace_bytes \
+                and length_class is not StreamProtocol \
+                and length_class is _defining_class(cls, "test_packet_complete")
+
+    @classmethod
+    def _refresh_if_changed(cls) -> None:
+        """Runs `refresh()` if anything it derives from has been reassigned."""
+
+        if cls.terminal_bytes is not cls._terminal_source \
+                or cls.backspace_bytes is not cls._backspace_source \
+                or _class_attribute(cls, "test_packet_start") is not cls._start_source \
+                or _class_attribute(cls, "test_packet_complete") is not cls._complete_source:
+            cls.refresh()
+
     @classmethod
     def calculate_packing_info(cls, fields) -> dict:
         """Build a struct.pack format string and calculate expected data length
@@ -49,23 +181,37 @@ class StreamProtocol():
                 packing structure
         :type fields: list
 
-        :returns: Dictionary containing packing format and calculated data
-                length in bytes
+        :returns: Dictionary containing packing format, precompiled struct
+                objects, and calculated data length in bytes
         :rtype: dict
+
+        The result is cached per field definition list, so repeated calls for
+        the same definition (as happens for every packet) cost a single dict
+        lookup. Field definition lists must therefore not be modified in place
+        after they have been used to pack or unpack data.
         """
 
+        key = (cls, id(fields))
+        cached = _cache_lookup(_packing_info_cache, key, fields)
+        if cached is not None:
+            return cached
+
         pack_format = ""
         expected_length = 0
         little_endian = False
         big_endian = False
+        plan = []
+        unpacked_index = 0
 
         # build out unpack format string and calculate expected byte count
         for field in fields:
             # use format and length from field type definition
-            pack_format += cls.types[field["type"]]["pack"]
-            expected_length += cls.types[field["type"]]["width"]
-            if cls.types[field["type"]]["width"] > 1:
-                if "byteorder" in field and field["byteorder"] == Order.BIG_ENDIAN:
+            field_type = cls.types[field["type"]]
+            field_big_endian = "byteorder" in field and field["byteorder"] == Order.BIG_ENDIAN
+            pack_format += field_type["pack"]
+            expected_length += field_type["width"]
+            if field_type["width"] > 1:
+                if field_big_endian:
                     big_endian = True
                 else:
                     little_endian = True
@@ -76,6 +222,21 @@ class StreamProtocol():
                 pack_format += "%ds" % field["width"]
                 expected_length += field["width"]
 
+            # resolve per-field handling once so packing only does int compares
+            if field["type"] in ["uint8a-l8v", "uint8a-l16v"]:
+                kind = _FIELD_PREFIXED_BLOB
+            elif field["type"] == "uint8a-greedy":
+                kind = _FIELD_GREEDY_BLOB
+            elif field["type"] == "macaddr":
+                kind = _FIELD_MACADDR
+            else:
+                kind = _FIELD_STANDARD
+            plan.append((field["name"], kind, unpacked_index, field_big_endian))
+
+            # greedy blobs have no fixed part, so they don't produce a value
+            if kind != _FIELD_GREEDY_BLOB:
+                unpacked_index += 1
+
         # check byte ordering
         if big_endian and not little_endian:
             # life is easy, everything is the same byte order
@@ -87,7 +248,64 @@ class StreamProtocol():
         # let's very much hope not
         mixed_endian = (big_endian and little_endian)
 
-        return { "pack_format": pack_format, "expected_length": expected_length, "mixed_endian": mixed_endian }
+        # precompile the format(s) so packing and unpacking skip format parsing
+        packing_info = {
+            "pack_format": pack_format,
+            "expected_length": expected_length,
+            "mixed_endian": mixed_endian,
+            "struct": struct.Struct(pack_format),
+            "struct_be": struct.Struct(">" + pack_format[1:]) if mixed_endian else None,
+            "plan": plan,
+            "names": tuple(field["name"] for field in fields),
+            "required_names": frozenset(field["name"] for field in fields),
+            "is_fixed": not mixed_endian and all(step[1] == _FIELD_STANDARD for step in plan),
+        }
+
+        # store for next time
+        _cache_store(_packing_info_cache, key, fields, packing_info)
+
+        return packing_info
+
+    @classmethod
+    def calculate_offsets(cls, fields) -> dict:
+        """Determine the byte offsets of all fields within a packed byte
+        buffer.
+
+        :param fields: A list containing field definitions describing the
+                packing structure
+        :type fields: list
+
+        :returns: Dictionary of byte offsets (keys are field names)
+        :rtype: dict
+
+        Like packing info, the result is cached per field definition list, so
+        looking up several offsets for the same definition only walks the list
+        once. If a name appears more than once, the first offset is used.
+        """
+
+        key = (cls, id(fields))
+        cached = _cache_lookup(_field_offset_cache, key, fields)
+        if cached is not None:
+            return cached
+
+        offsets = {}
+        offset = 0
+        for field in fields:
+            # record the current offset for this field
+            offsets.setdefault(field["name"], offset)
+
+            # add this width to the running offset
+            offset += cls.types[field["type"]]["width"]
+
+            # process types that require special handling
+            if field["type"] == "uint8a-fixed":
+                # fixed-width uint8a fields specify their own width
+                offset += field["width"]
+
+        # store for next time
+        _cache_store(_field_offset_cache, key, fields, offsets)
+
+        return offsets
 
     @classmethod
     def calculate_field_offset(cls, fields, field_name) -> int:
@@ -105,22 +323,7 @@ class StreamProtocol():
         :rtype: int
         """
 
-        offset = 0
-        for field in fields:
-            if field["name"] == field_name:
-                # found the field, so use the current offset
-                return offset
-            else:
-                # not found yet, so add this width to the running offset
-                offset += cls.types[field["type"]]["width"]
-
-                # process types that require special handling
-                if field["type"] == "uint8a-fixed":
-                    # fixed-width uint8a fields specify their own width
-                    offset += field["width"]
-
-        # not found
-        return None
+        return cls.calculate_offsets(fields).get(field_name)
 
     @classmethod
     def pack_values(cls, values, fields, packing_info=None) -> bytes:
@@ -134,8 +337,9 @@ class StreamProtocol():
                 packing structure
         :type fields: list
 
-        :param packing_info: A dictionary containing the packing format string
-                and expected length in bytes for the corresponding buffer
+        :param packing_info: A dictionary containing the packing format, plan,
+                and expected length in bytes for the corresponding buffer, as
+                returned by `calculate_packing_info()`
         :type packing_info: dict
 
         :returns: Packet byte buffer packed from dictionary
@@ -149,28 +353,45 @@ class StreamProtocol():
         if packing_info is None:
             packing_info = cls.calculate_packing_info(fields)
 
+        # variable-length fields add format fragments to a local list, so the
+        # (possibly cached) packing info is never modified
+        format_parts = [packing_info["pack_format"]]
+        # make sure every field has a value (one set operation for all fields)
+        missing = packing_info["required_names"] - values.keys()
+        if missing:
+            # report the first missing field in definition order
+            name = next(name for name in packing_info["names"] if name in missing)
+            raise PerilibProtocolException("Field '%s' value is required to build packet " % name)
+
+        # fixed-layout fields map one-to-one onto the compiled struct
+        if packing_info["is_fixed"]:
+            return packing_info["struct"].pack(*[values[name] for name in packing_info["names"]])
+
         value_list = []
-        for field in fields:
-            if field["name"] not in values:
-                raise PerilibProtocolException("Field '%s' value is required to build packet " % field["name"])
-            if field["type"] in ["uint8a-l8v", "uint8a-l16v"]:
+        for name, kind, index, big_endian in packing_info["plan"]:
+            if kind == _FIELD_PREFIXED_BLOB:
                 # variable-length blob with 8-bit or 16-bit length prefix
-                blob = bytes(values[field["name"]])
-                packing_info["pack_format"] += ("%ds" % len(blob))
+                blob = bytes(values[name])
+                format_parts.append("%ds" % len(blob))
                 value_list.append(len(blob))
                 value_list.append(blob)
-            elif field["type"] == "uint8a-greedy":
+            elif kind == _FIELD_GREEDY_BLOB:
                 # greedy byte blob with no specified length prefix, so it's only
                 # possible to know/specify the length at packing time
-                blob = bytes(values[field["name"]])
-                packing_info["pack_format"] += ("%ds" % len(blob))
+                blob = bytes(values[name])
+                format_parts.append("%ds" % len(blob))
                 value_list.append(blob)
             else:
                 # standard argument
-                value_list.append(values[field["name"]])
+                value_list.append(values[name])
 
         # pack all arguments into binary buffer
-        return struct.pack(packing_info["pack_format"], *value_list)
+        if len(format_parts) > 1:
+            # struct keeps its own cache of compiled formats, so repeated blob
+            # lengths don't pay for format parsing again
+            return struct.pack("".join(format_parts), *value_list)
+        else:
+            return packing_info["struct"].pack(*value_list)
 
     @classmethod
     def unpack_values(cls, buffer, fields, packing_info=None) -> dict:
@@ -184,8 +405,9 @@ class StreamProtocol():
                 packing structure
         :type fields: list
 
-        :param packing_info: A dictionary containing the packing format string
-                and expected length in bytes for the corresponding buffer
+        :param packing_info: A dictionary containing the packing format, plan,
+                and expected length in bytes for the corresponding buffer, as
+                returned by `calculate_packing_info()`
         :type packing_info: dict
 
         :returns: Dictionary unpacked from byte buffer
@@ -196,61 +418,85 @@ class StreamProtocol():
         some external methods require access to it for pre-processing, and so
         it would be a waste to force the calculation twice."""
 
-        values = dotdict()
-
         if packing_info is None:
             packing_info = cls.calculate_packing_info(fields)
 
         # make sure calculated lengths are sane
-        if packing_info["expected_length"] > len(buffer):
-            raise PerilibProtocolException("Calculated minimum buffer length %d exceeds actual buffer length %d" % (packing_info["expected_length"], len(buffer)))
+        expected_length = packing_info["expected_length"]
+        buffer_length = len(buffer)
+        if expected_length > buffer_length:
+            raise PerilibProtocolException("Calculated minimum buffer length %d exceeds actual buffer length %d" % (expected_length, buffer_length))
 
-        unpacked = struct.unpack(packing_info["pack_format"], buffer[:packing_info["expected_length"]])
+        # unpack directly from the buffer without slicing off trailing data
+        unpacked = packing_info["struct"].unpack_from(buffer)
+
+        # fixed-layout fields map one-to-one onto the unpacked values
+        if packing_info["is_fixed"]:
+            return dotdict(zip(packing_info["names"], unpacked))
         unpacked_be = []
-        if packing_info["mixed_endian"]:
+        mixed_endian = packing_info["mixed_endian"]
+        if mixed_endian:
             # unpack it again with big-endian byte ordering (ugh)
-            be_format = ">" + packing_info["pack_format"][1:]
-            unpacked_be = struct.unpack(be_format, buffer[:packing_info["expected_length"]])
-        for i, field in enumerate(fields):
-            if field["type"] in ["uint8a-l8v", "uint8a-l16v", "uint8a-greedy"]:
-                # use the byte array contained in the rest of the payload
-                if field["type"] != "uint8a-greedy" and unpacked[i] + packing_info["expected_length"] != len(buffer):
-                    raise PerilibProtocolException(
-                        "Specified variable payload length %d does not match actual "
-                        "remaining payload length %d"
-                        % (unpacked[i], len(buffer) - packing_info["expected_length"]))
-                values[field["name"]] = buffer[packing_info["expected_length"]:]
-            elif field["type"] == "macaddr":
+            unpacked_be = packing_info["struct_be"].unpack_from(buffer)
+        field_values = []
+        for name, kind, index, big_endian in packing_info["plan"]:
+            if kind == _FIELD_STANDARD:
+                # directly use the value extracted during unpacking
+                if mixed_endian and big_endian:
+                    field_values.append(unpacked_be[index])
+                else:
+                    field_values.append(unpacked[index])
+            elif kind == _FIELD_MACADDR:
                 # special handling for 6-byte MAC address
-                if "byteorder" in field and field["byteorder"] == Order.BIG_ENDIAN:
-                    values[field["name"]] = list(reversed([x for x in unpacked[i]]))
+                if big_endian:
+                    field_values.append(list(reversed(unpacked[index])))
                 else:
-                    values[field["name"]] = [x for x in unpacked[i]]
+                    field_values.append(list(unpacked[index]))
             else:
-                # directly use the value extracted during unpacking
-                if packing_info["mixed_endian"] and "byteorder" in field and field["byteorder"] == Order.BIG_ENDIAN:
-                    values[field["name"]] = unpacked_be[i]
-                else:
-                    values[field["name"]] = unpacked[i]
+                # use the byte array contained in the rest of the payload
+                if kind == _FIELD_PREFIXED_BLOB and unpacked[index] + expected_length != buffer_length:
+                    cls._raise_payload_length_mismatch(unpacked[index], buffer_length - expected_length)
+                field_values.append(bytes(buffer[expected_length:]))
+
+        # build the dictionary in one step from the collected values
+        return dotdict(zip(packing_info["names"], field_values))
+
+    @classmethod
+    def _raise_payload_length_mismatch(cls, specified_length, actual_length) -> None:
+        """Raise an exception for an inconsistent variable-length field.
+
+        :param specified_length: Length given in the packet's length prefix
+        :type specified_length: int
 
-        # done!
-        return values
+        :param actual_length: Number of bytes actually remaining in the buffer
+        :type actual_length: int
+
+        Kept separate from `unpack_values()` so that the message formatting
+        only exists on the error path."""
+
+        raise PerilibProtocolException(
+                "Specified variable payload length %d does not match actual "
+                "remaining payload length %d"
+                % (specified_length, actual_length))
 
     @classmethod
     def test_packet_start(cls, buffer, is_tx=False) -> ParseStatus:
         """Test whether a packet has started.
 
         :param buffer: Current data buffer
-        :type buffer: bytes
+        :type buffer: bytearray
 
         :param is_tx: Whether the data is incoming (false) or outgoing (true)
         :type is_tx: boolean
 
         Since many protocols have a unique mechanism for determining the start
         of a new frame (e.g. 0x55 byte), this method may be overridden to use a
-        more complex test based on the contents of the `buffer` argument (which
-        is a `bytes` object). The default implementation here assumes that any
-        data received is the beginning of a new packet.
+        more complex test based on the contents of the `buffer` argument. This is
+        the parser's own receive buffer, a mutable `bytearray` that keeps
+        changing as more data arrives; it must not be modified, kept beyond the
+        call, or hashed (copy it with `bytes()` if necessary). The default
+        implementation here assumes that any data received is the beginning of
+        a new packet.
 
         Available return values are STATUS_IN_PROGRESS to indicate that the
         packet has started, STATUS_STARTING to indicate that additional bytes
@@ -268,7 +514,7 @@ class StreamProtocol():
         """Test whether a packet has finished.
 
         :param buffer: Current data buffer (not including new byte)
-        :type buffer: bytes
+        :type buffer: bytearray
 
         :param is_tx: Whether the data is incoming (false) or outgoing (true)
         :type is_tx: boolean
@@ -278,8 +524,10 @@ class StreamProtocol():
         packets end with a CRC block or other type of validation data that must
         be checked in order to accept the packet as valid. This method may be
         overridden to check whatever conditions are necessary against on the
-        contents of the `buffer` argument (which is a `bytes` object). The
-        default implementation here assumes any data is the end of a new packet.
+        contents of the `buffer` argument. As with `test_packet_start()`, this
+        is the parser's mutable `bytearray` receive buffer, which must not be
+        modified, kept beyond the call, or hashed. The default implementation
+        here assumes any data is the end of a new packet.
 
         NOTE: in combination with the default start test condition, this means
         that each individual byte received is treated as a complete packet. This
@@ -295,13 +543,15 @@ class StreamProtocol():
         This class method is called automatically by the parser/generator object
         when new data is received and passed to the parse method."""
 
+        # pick up a terminal or backspace list assigned since the last refresh
+        if cls.terminal_bytes is not cls._terminal_source or cls.backspace_bytes is not cls._backspace_source:
+            cls.refresh()
+
         # check for simple byte-based terminal condition
-        if cls.terminal_bytes is not None and len(cls.terminal_bytes) > 0:
-            # check for a byte match
-            for b in cls.terminal_bytes:
-                if buffer[-1] == b:
-                    # matching terminal byte, packet is complete
-                    return ParseStatus.COMPLETE
+        if cls._terminal_tuple:
+            # matching terminal sequence means the packet is complete
+            if buffer.endswith(cls._terminal_tuple):
+                return ParseStatus.COMPLETE
 
             # no match, packet is incomplete
             return ParseStatus.IN_PROGRESS
@@ -309,6 +559,35 @@ class StreamProtocol():
         # no terminal conditions, assume completion after any byte
         return ParseStatus.COMPLETE
 
+    @classmethod
+    def get_packet_length(cls, buffer, is_tx=False) -> int:
+        """Determine the total length of a packet from its partial buffer.
+
+        :param buffer: Current data buffer (the parser's mutable receive buffer,
+                not to be modified or kept)
+        :type buffer: bytearray
+
+        :param is_tx: Whether the data is incoming (false) or outgoing (true)
+        :type is_tx: boolean
+
+        :returns: Total packet length in bytes, or None if not yet known
+        :rtype: int
+
+        Protocols which declare the packet length near the start of each packet
+        (such as TLV or LTV data) may override this method to report it as soon
+        as enough of the buffer has arrived. The parser then appends everything
+        up to the last byte of the packet directly to its buffer when data is
+        supplied in chunks, instead of testing each byte separately. The last
+        byte is still passed through `test_packet_complete()` as usual, which
+        must not report completion any earlier than the length given here. This
+        shortcut is only used if both methods are defined in the same class, so
+        subclasses overriding just the completion test are parsed byte by byte.
+
+        The default implementation here does not know the length of anything,
+        so every byte is tested individually."""
+
+        return None
+
     @classmethod
     def get_packet_from_buffer(cls, buffer, parser_generator=None, is_tx=False) -> object:
         """Generates a packet object from a binary buffer.
@@ -4,23 +4,35 @@ from .StreamPacket import *
 
 class TLVStreamProtocol(StreamProtocol):
 
+    definition = {
+        "name": "tlv_packet",
+        "args": [
+            { "name": "type", "type": "uint8" },
+            { "name": "length", "type": "uint8" },
+            { "name": "value", "type": "uint8a-greedy" }
+        ]
+    }
+
     @classmethod
     def test_packet_complete(cls, buffer, is_tx=False) -> ParseStatus:
         # simple terminal condition for TLV data, where T/L are single bytes
         # [type] [length] [v0, v1, ..., v<length>]
-        if len(buffer) > 1 and len(buffer) == buffer[1] + 2:
+        length = len(buffer)
+        if length < 2:
+            # length byte has not arrived yet
+            return ParseStatus.IN_PROGRESS
+        elif length == buffer[1] + 2:
             return ParseStatus.COMPLETE
         else:
             return ParseStatus.IN_PROGRESS
 
+    @classmethod
+    def get_packet_length(cls, buffer, is_tx=False) -> int:
+        # total length is known once the length byte has arrived
+        if len(buffer) < 2:
+            return None
+        return buffer[1] + 2
+
     @classmethod
     def get_packet_from_buffer(cls, buffer, parser_generator=None, is_tx=False) -> StreamPacket:
-        definition = {
-            "name": "tlv_packet",
-            "args": [
-                { "name": "type", "type": "uint8" },
-                { "name": "length", "type": "uint8" },
-                { "name": "value", "type": "uint8a-greedy" }
-            ]
-        }
-        return StreamPacket(buffer=buffer, definition=definition, parser_generator=parser_generator)
+        return StreamPacket(buffer=buffer, definition=cls.definition, parser_generator=parser_generator)
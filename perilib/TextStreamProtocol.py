@@ -8,12 +8,13 @@ class TextStreamProtocol(StreamProtocol):
     terminal_bytes = [0x0A]
     trim_bytes = [0x0A, 0x0D]
 
+    definition = {
+        "name": "text_packet",
+        "args": [
+            { "name": "text", "type": "uint8a-greedy" }
+        ]
+    }
+
     @classmethod
     def get_packet_from_buffer(cls, buffer, parser_generator=None, is_tx=False) -> StreamPacket:
-        definition = {
-            "name": "text_packet",
-            "args": [
-                { "name": "text", "type": "uint8a-greedy" }
-            ]
-        }
-        return StreamPacket(buffer=buffer, definition=definition, parser_generator=parser_generator)
+        return StreamPacket(buffer=buffer, definition=cls.definition, parser_generator=parser_generator)
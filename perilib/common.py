@@ -1,15 +1,17 @@
-class ProcessMode:
+import enum
+
+class ProcessMode(enum.IntEnum):
     SELF = 1
     SUBS = 2
     BOTH = 3
 
-class ParseStatus:
+class ParseStatus(enum.IntEnum):
     IDLE = 0
     STARTING = 1
     IN_PROGRESS = 2
     COMPLETE = 3
 
-class Order:
+class Order(enum.IntEnum):
     LITTLE_ENDIAN = 0
     BIG_ENDIAN = 1
 
@@ -1,3 +1,13 @@
+import os
+import sys
+import time
+
+try:
+    # optional, used for hot-plug notifications on Linux
+    import pyudev
+except ImportError:
+    pyudev = None
+
 from .UartStream import *
 from ..Exceptions import *
 from ..Manager import *
@@ -78,12 +88,78 @@ class UartManager(Manager):
         self.on_incoming_packet_timeout = None
         self.on_waiting_packet_timeout = None
         self.auto_open = UartManager.AUTO_OPEN_NONE
+        self.port_list_max_age = 10.0
 
         # these attributes are intended to be read-only
         self.streams = {}
 
         # these attributes are intended to be private
-        self._recently_disconnected_devices = []
+        self._recently_disconnected_devices = set()
+        self._last_port_set = frozenset()
+        self._last_connected_devices = {}
+        self._port_list = None
+        self._port_list_time = 0
+        self._udev_monitor = self._create_udev_monitor()
+
+    def _create_udev_monitor(self) -> object:
+        """Creates a udev monitor for serial device hot-plug events, if possible.
+
+        :returns: Started non-blocking udev monitor, or None if unavailable
+        :rtype: pyudev.Monitor
+
+        On Linux with `pyudev` installed, the manager listens for kernel
+        notifications about added or removed tty devices, and only enumerates
+        serial ports again when one of these has arrived. Enumeration is
+        comparatively expensive and (depending on the driver) is not entirely
+        free of side effects, so there is no reason to repeat it while nothing
+        changes. On other platforms, if udevd is not running (in which case
+        no events are ever delivered), or if the monitor cannot be created,
+        ports are enumerated on every check interval as usual."""
+
+        if pyudev is None or not sys.platform.startswith("linux"):
+            return None
+
+        if not os.path.exists("/run/udev/control"):
+            # no udev daemon to forward kernel events to the monitor
+            return None
+
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem="tty")
+            monitor.start()
+            return monitor
+        except (OSError, ImportError):
+            # netlink socket unavailable (e.g. restricted container)
+            return None
+
+    def _get_port_list(self) -> list:
+        """Gets a list of information about all currently available serial ports.
+
+        :returns: List of port information objects from PySerial
+        :rtype: list
+
+        If a udev monitor is active, the previously enumerated list is reused
+        until the monitor reports a tty device change, or until it is older
+        than `port_list_max_age` seconds (in case an event was missed)."""
+
+        now = time.monotonic()
+        if self._udev_monitor is not None and self._port_list is not None \
+                and now - self._port_list_time < self.port_list_max_age:
+            # drain pending events without blocking
+            changed = False
+            try:
+                while self._udev_monitor.poll(timeout=0) is not None:
+                    changed = True
+            except OSError:
+                # events were lost (e.g. ENOBUFS), so assume something changed
+                changed = True
+
+            if not changed:
+                return self._port_list
+
+        self._port_list = serial.tools.list_ports.comports()
+        self._port_list_time = now
+        return self._port_list
 
     def _get_connected_devices(self) -> dict:
         """Gets a collection of all currently connected serial devices.
@@ -96,24 +172,45 @@ class UartManager(Manager):
         some way (e.g. stream attached and/or opened) will retain their state.
         Previously unknown devices are instantiated immediately, while known
         devices are reused from their previous position in the internal device
-        list."""
+        list.
+
+        If the set of available ports has not changed since the previous check
+        (and no device has been disconnected in the meantime, and no port was
+        rejected by `port_info_filter`), the previous result is returned again
+        without walking the port list."""
+
+        port_list = self._get_port_list()
+        port_set = frozenset(port_info.device for port_info in port_list)
+        if port_set == self._last_port_set and not self._recently_disconnected_devices:
+            # nothing has changed since the last check
+            return dict(self._last_connected_devices)
+
+        # only the device name is needed for known ports, and the filter is
+        # only consulted for new ones, so other port info fields are untouched
+        port_info_filter = self.port_info_filter
+        recently_disconnected_devices = self._recently_disconnected_devices
+        known_devices = self.devices
 
         connected_devices = {}
-        for port_info in serial.tools.list_ports.comports():
-            if port_info.device in self._recently_disconnected_devices:
+        rejected_ports = set()
+        for port_info in port_list:
+            device_id = port_info.device
+            if device_id in recently_disconnected_devices:
                 # skip reporting this device for one iteration (works around rare
                 # but observed case where Windows shows a device as being still
                 # connected when a serial read operation has already thrown an
                 # exception due to an unavailable pipe)
                 continue
-            if port_info.device in self.devices:
+            device = known_devices.get(device_id)
+            if device is not None:
                 # use existing device instance
-                connected_devices[port_info.device] = self.devices[port_info.device]
+                connected_devices[device_id] = device
             else:
                 # create new device and stream instance
 
                 # apply filter, skip if it doesn't pass
-                if self.port_info_filter is not None and not self.port_info_filter(port_info):
+                if port_info_filter is not None and not port_info_filter(port_info):
+                    rejected_ports.add(device_id)
                     continue
 
                 # make sure the application provided everything necessary
@@ -131,24 +228,49 @@ class UartManager(Manager):
 
                 # create and attach PySerial port instance to stream (not opened yet)
                 stream.port = serial.Serial()
-                stream.port.port = port_info.device
+                stream.port.port = device_id
                 stream.port_info = port_info
 
                 # create device with stream attached
-                device = self.device_class(port_info.device, stream)
+                device = self.device_class(device_id, stream)
 
                 # add reference from stream back up to device for convenience
                 stream.device = device
 
                 # add device and stream to internal tables for management
-                self.streams[port_info.device] = stream
-                connected_devices[port_info.device] = device
+                self.streams[device_id] = stream
+                connected_devices[device_id] = device
+
+        # skipped and rejected devices must not count as seen, so they are
+        # picked up again (or offered to the filter again, which may have been
+        # replaced or depend on application state) on the next iteration if
+        # they are still present
+        self._last_port_set = port_set - self._recently_disconnected_devices - rejected_ports
 
-        # clean out list of recently disconnected devices
-        del self._recently_disconnected_devices[:]
+        # clean out set of recently disconnected devices
+        self._recently_disconnected_devices.clear()
 
         # send back the list of currently connected devices
-        return connected_devices
+        self._last_connected_devices = connected_devices
+        return dict(connected_devices)
+
+    def _is_device_lost(self, device) -> bool:
+        """Checks whether a missing device cannot simply resume if it comes back.
+
+        :param device: Device that is missing from the connected device list
+        :type device: SerialDevice
+
+        :returns: True if the device must be disconnected despite debouncing
+        :rtype: bool
+
+        A stream that is closed while its device is missing (e.g. after a failed
+        read) is never opened again for a device that is still known, whether
+        it was opened automatically or by the application. Such a device is
+        treated as lost, and a real disconnection lets it be detected again as
+        a new device, with the usual callbacks and auto-open behavior."""
+
+        stream = self.streams.get(device.id)
+        return stream is not None and not stream.is_open
 
     def _on_connect_device(self, device) -> None:
         """Handles serial device connections.
@@ -181,19 +303,21 @@ class UartManager(Manager):
                     open_stream = True
 
             if open_stream == True:
+                stream = self.streams[device.id]
+
                 # create and configure parser/generator object if protocol is available
                 if self.protocol_class != None:
-                    parser_generator = self.parser_generator_class(protocol_class=self.protocol_class, stream=self.streams[device.id])
+                    parser_generator = self.parser_generator_class(protocol_class=self.protocol_class, stream=stream)
                     parser_generator.on_rx_packet = self.on_rx_packet
                     parser_generator.on_tx_packet = self.on_tx_packet
                     parser_generator.on_rx_error = self.on_rx_error
                     parser_generator.on_incoming_packet_timeout = self.on_incoming_packet_timeout
                     parser_generator.on_waiting_packet_timeout = self.on_waiting_packet_timeout
-                    self.streams[device.id].parser_generator = parser_generator
+                    stream.parser_generator = parser_generator
 
                 try:
                     # open the data stream
-                    self.streams[device.id].open()
+                    stream.open()
                 except serial.serialutil.SerialException as e:
                     # unable to open the port, but don't crash
                     pass
@@ -210,17 +334,18 @@ class UartManager(Manager):
         resumes monitoring in the case of auto-open-first configuration."""
 
         # mark as recently disconnected
-        self._recently_disconnected_devices.append(device.id)
+        self._recently_disconnected_devices.add(device.id)
 
         # close and remove stream if it is open and/or just present
-        if device.id in self.streams:
-            self.streams[device.id].close()
-            del self.streams[device.id]
+        stream = self.streams.pop(device.id, None)
+        if stream is not None:
+            stream.close()
 
         run_builtin = True
         if self.on_disconnect_device is not None:
             # trigger the app-level disconnection callback
             run_builtin = self.on_disconnect_device(device)
 
-        # remove the device itself from our list
-        del self.devices[device.id]
+        # remove the device itself from our list (may already be gone if the
+        # application callback removed it)
+        self.devices.pop(device.id, None)
@@ -1,4 +1,5 @@
 import serial
+import time
 import serial.tools.list_ports
 
 from ..Stream import *
@@ -6,12 +7,55 @@ from ..Stream import *
 #from ..StreamParserGenerator import *
 #from ..StreamProtocol import *
 
+# errors that indicate the port has gone away during a read or close
+_PORT_EXCEPTIONS = (OSError, serial.serialutil.SerialException)
+
 class UartStream(Stream):
     """Serial stream class providing a bidirectional data stream to a serial device.
 
     This class allows reading to and writing from a serial device, using PySerial
     as the low-level driver."""
 
+    # maximum number of bytes requested from the port in a single read
+    rx_chunk_size = 4096
+
+    def __init__(self, device=None, parser_generator=None):
+        """Initializes a serial stream instance.
+
+        :param device: Device which manages this stream, if one exists
+        :type device: Device
+
+        :param parser_generator: Parser/generator object which this stream
+            sends and receives data through, if one exists
+        :type parser_generator: ParserGenerator
+
+        Received data is normally passed on as soon as it is read. Setting
+        `rx_batch_size` above 1 holds incoming data back until at least that
+        many bytes have accumulated, or until the oldest held byte has waited
+        `rx_batch_time` seconds, so that the parser is entered less often on
+        fast links at the cost of some added latency.
+
+        With `low_latency` enabled (the default), the driver is asked to pass
+        received bytes up immediately when the port is opened, rather than
+        buffering them for a few milliseconds as many USB serial adapters do.
+        This is only supported on Linux and is silently skipped elsewhere.
+
+        Unlike most of the overridden methods in this child class, this one runs
+        the parent (super) class method first.
+        """
+
+        # run parent constructor
+        super().__init__(device=device, parser_generator=parser_generator)
+
+        # these attributes may be updated by the application
+        self.rx_batch_size = 1
+        self.rx_batch_time = 0
+        self.low_latency = True
+
+        # these attributes are intended to be private
+        self._rx_batch = bytearray()
+        self._rx_batch_t0 = 0
+
     def __str__(self):
         """Generates the string representation of the serial stream.
 
@@ -27,14 +71,19 @@ class UartStream(Stream):
         :returns: Status of open attempt
         :rtype: bool
 
-        This opens the serial port if it is not already open."""
+        This opens the serial port if it is not already open. The port is put
+        into non-blocking mode, since `process()` reads whatever is available
+        without checking first."""
 
         # don't start if we're already running
         if not self.is_open:
             try:
+                self.port.timeout = 0
                 if not self.port.is_open:
                     self.port.open()
                     self._port_open = True
+                    if self.low_latency:
+                        self._set_low_latency_mode()
                 if self.on_open_stream is not None:
                     # trigger application callback
                     self.on_open_stream(self)
@@ -47,6 +96,20 @@ class UartStream(Stream):
 
         return self.is_open
 
+    def _set_low_latency_mode(self) -> None:
+        """Enables the low latency flag on the underlying serial port, if possible.
+
+        PySerial only implements this for Linux (setting `ASYNC_LOW_LATENCY`
+        via the `TIOCSSERIAL` ioctl, which lowers the FTDI latency timer from
+        16ms to 1ms, for example). Ports or drivers that don't support it are
+        left unchanged."""
+
+        try:
+            self.port.set_low_latency_mode(True)
+        except (AttributeError, NotImplementedError, ValueError, OSError) as e:
+            # not supported on this platform or by this driver
+            pass
+
     def close(self) -> bool:
         """Closes the serial stream.
 
@@ -106,34 +169,81 @@ class UartStream(Stream):
         associated parser/generator objects."""
 
         try:
-            # check for available data
-            if mode in [ProcessMode.SELF, ProcessMode.BOTH] \
-                    and self.is_open \
-                    and self.port.is_open \
-                    and self.port.in_waiting != 0:
-                # read all available data
-                data = self.port.read(self.port.in_waiting)
-
-                # pass data to internal receive callback
-                self._on_rx_data(data)
+            # check for available data (mode values are bit flags, BOTH being
+            # SELF | SUBS, and port.is_open is a plain attribute, not a driver
+            # call)
+            port = self.port
+            if mode & ProcessMode.SELF and self.is_open and port.is_open:
+                # read available data (non-blocking, so this returns nothing
+                # immediately when idle instead of querying in_waiting first)
+                rx_chunk_size = self.rx_chunk_size
+                data = port.read(rx_chunk_size)
+                if data:
+                    # pass data to internal receive callback
+                    self._queue_rx_data(data)
+
+                    if len(data) == rx_chunk_size and port.in_waiting:
+                        # chunk filled up, so drain whatever else is waiting
+                        # (passed on separately instead of concatenated, since
+                        # the parser handles arbitrary chunk boundaries anyway)
+                        self._queue_rx_data(port.read(port.in_waiting))
+
+                # release held data once it has waited long enough
+                if self._rx_batch and time.monotonic() - self._rx_batch_t0 >= self.rx_batch_time:
+                    self._flush_rx_batch()
 
             # allow associated parser/generator to process immediately
-            if mode in [ProcessMode.BOTH, ProcessMode.SUBS]:
-                if self.parser_generator is not None:
-                    self.parser_generator.process(mode=ProcessMode.BOTH, force=force)
+            if mode & ProcessMode.SUBS:
+                parser_generator = self.parser_generator
+                if parser_generator is not None:
+                    parser_generator.process(mode=ProcessMode.BOTH, force=force)
 
-        except (OSError, serial.serialutil.SerialException) as e:
+        except _PORT_EXCEPTIONS as e:
             # read failed, probably port closed or device removed
             # trigger appropriate closure/disconnection callbacks
             self._cleanup_port_closure()
 
+    def _queue_rx_data(self, data) -> None:
+        """Passes received data on, or holds it for batched delivery.
+
+        :param data: Data buffer that has just been received
+        :type data: bytes
+
+        With batching disabled (the default), data goes straight to the
+        internal receive callback."""
+
+        if self.rx_batch_size <= 1:
+            if self._rx_batch:
+                # batching was disabled while data was held, which goes first
+                self._flush_rx_batch()
+            self._on_rx_data(data)
+            return
+
+        if not self._rx_batch:
+            # start timing from the oldest held byte
+            self._rx_batch_t0 = time.monotonic()
+        self._rx_batch += data
+        if len(self._rx_batch) >= self.rx_batch_size:
+            self._flush_rx_batch()
+
+    def _flush_rx_batch(self) -> None:
+        """Passes all held received data to the internal receive callback."""
+
+        data = bytes(self._rx_batch)
+        self._rx_batch.clear()
+        self._on_rx_data(data)
+
     def _cleanup_port_closure(self) -> None:
         """Handle a closed port cleanly.
 
         A serial port may close due to device removal (unexpected) or due to
         stream closure (expected). In either case, the internal port closure
         status value is updated here, and in the case of an unexpected closure,
-        the device disconnection callback is triggered."""
+        the device disconnection callback is triggered. Any received data still
+        held for batching is passed on first."""
+
+        if self._rx_batch:
+            self._flush_rx_batch()
 
         # mark data stream publicly closed
         self.is_open = False
@@ -147,7 +257,7 @@ class UartStream(Stream):
             try:
                 # might fail due if the underlying port is already closed
                 self.port.close()
-            except (OSError, serial.serialutil.SerialException) as e:
+            except _PORT_EXCEPTIONS as e:
                 # silently ignore failures to close the port, but that means the device is gone
                 if self.on_disconnect_device:
                     # trigger application callback